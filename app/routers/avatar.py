@@ -1,7 +1,7 @@
 """Avatar streaming router for LiveTalking integration"""
 
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db
@@ -49,19 +49,26 @@ async def create_session(
 @router.post("/send-text", response_model=MessageResponse)
 async def send_text(
     data: SendTextRequest,
+    response: Response,
     user: User = Depends(get_current_user),
 ):
     """
     Send text to avatar for TTS processing.
 
     The avatar will speak the provided text using the configured TTS engine.
+    Non-interrupting texts are queued and answered with 202 Accepted; if a
+    queued text later fails to send, the next request for the session
+    returns 503.
     """
     try:
-        await livetalking_service.send_text(
+        sent = await livetalking_service.send_text(
             session_id=data.session_id,
             text=data.text,
             interrupt=data.interrupt,
         )
+        if not sent:
+            response.status_code = status.HTTP_202_ACCEPTED
+            return MessageResponse(success=True, message="Text queued")
         return MessageResponse(success=True, message="Text sent successfully")
     except ConnectionError as e:
         raise HTTPException(
@@ -153,17 +153,14 @@ async def get_job_queue_status(
 
     Requires X-API-Key header for authentication.
     """
-    running = await avatar_job_service.get_running_count(db)
-    pending = await avatar_job_service.get_pending_count(db)
-    completed_today = await avatar_job_service.get_jobs_completed_today(db)
-    failed_today = await avatar_job_service.get_jobs_failed_today(db)
+    counts = await avatar_job_service.get_queue_counts(db)
 
     return JobQueueStatusResponse(
-        running=running,
-        pending=pending,
+        running=counts["running"],
+        pending=counts["pending"],
         max_concurrent=avatar_job_service.max_concurrent,
-        completed_today=completed_today,
-        failed_today=failed_today,
+        completed_today=counts["completed_today"],
+        failed_today=counts["failed_today"],
     )
 
 
@@ -1,12 +1,9 @@
 """Billing router - Placeholder stubs for Stripe integration"""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from pydantic import BaseModel
 
-from app.db import get_db
-from app.models import User, Subscription
+from app.models import User
 from app.services.firebase import get_current_user
 
 router = APIRouter(prefix="/billing", tags=["Billing"])
@@ -31,17 +28,14 @@ class PurchaseMinutesRequest(BaseModel):
 @router.get("/subscription")
 async def get_subscription(
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """
     Get current subscription details.
 
     Returns mock data for now until Stripe is integrated.
     """
-    result = await db.execute(
-        select(Subscription).where(Subscription.user_id == user.id)
-    )
-    subscription = result.scalar_one_or_none()
+    # Eager-loaded by get_current_user
+    subscription = user.subscription
 
     if not subscription:
         # Return default free subscription
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
 from app.db import get_db
-from app.models import User, VideoModel, VoiceModel, GeneratedVideo, Subscription
+from app.models import User, VideoModel, VoiceModel, GeneratedVideo
 from app.services.firebase import get_current_user
 from app.services.usage_service import usage_service
 from app.schemas.generated_video import GeneratedVideoListItem
@@ -47,11 +47,8 @@ async def get_dashboard(
     )
     recent_videos = recent_result.scalars().all()
 
-    # Get subscription
-    sub_result = await db.execute(
-        select(Subscription).where(Subscription.user_id == user.id)
-    )
-    subscription = sub_result.scalar_one_or_none()
+    # Subscription is eager-loaded by get_current_user
+    subscription = user.subscription
 
     # Calculate period dates
     now = datetime.utcnow()
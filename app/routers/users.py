@@ -2,7 +2,6 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from app.db import get_db
 from app.models import User, UserProfile
@@ -24,11 +23,8 @@ async def create_or_update_profile(
     This endpoint is used to submit onboarding survey data.
     If profile exists, it updates it; otherwise creates new.
     """
-    # Check for existing profile
-    result = await db.execute(
-        select(UserProfile).where(UserProfile.user_id == user.id)
-    )
-    profile = result.scalar_one_or_none()
+    # Check for existing profile (eager-loaded by get_current_user)
+    profile = user.profile
 
     if profile:
         # Update existing profile
@@ -60,15 +56,12 @@ async def create_or_update_profile(
 @router.get("/profile", response_model=ProfileResponse)
 async def get_profile(
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """
     Get current user's profile.
     """
-    result = await db.execute(
-        select(UserProfile).where(UserProfile.user_id == user.id)
-    )
-    profile = result.scalar_one_or_none()
+    # Profile is eager-loaded by get_current_user
+    profile = user.profile
 
     if not profile:
         raise HTTPException(
@@ -88,10 +81,8 @@ async def update_profile(
     """
     Partially update user profile.
     """
-    result = await db.execute(
-        select(UserProfile).where(UserProfile.user_id == user.id)
-    )
-    profile = result.scalar_one_or_none()
+    # Profile is eager-loaded by get_current_user
+    profile = user.profile
 
     if not profile:
         raise HTTPException(
@@ -11,6 +11,7 @@ import tempfile
 from datetime import datetime
 from uuid import UUID
 
+import aiofiles.os
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -132,7 +133,7 @@ class AIService:
                     logger.info(f"Video was trimmed to {duration}s, re-uploading to S3")
 
                     # Get file size of trimmed video
-                    model.file_size_bytes = os.path.getsize(final_path)
+                    model.file_size_bytes = await aiofiles.os.path.getsize(final_path)
 
                     # Re-upload trimmed video to same S3 key
                     content_type = s3_service._get_content_type(final_path)
@@ -145,7 +146,7 @@ class AIService:
                 else:
                     logger.info(f"Video duration is {duration}s, no trimming needed")
                     # Update file size from original
-                    model.file_size_bytes = os.path.getsize(input_path)
+                    model.file_size_bytes = await aiofiles.os.path.getsize(input_path)
 
                 await db.commit()
 
@@ -154,7 +155,7 @@ class AIService:
                 duration = await get_video_duration(input_path)
                 if duration:
                     model.duration_seconds = int(duration)
-                    model.file_size_bytes = os.path.getsize(input_path)
+                    model.file_size_bytes = await aiofiles.os.path.getsize(input_path)
                     await db.commit()
                     logger.warning(f"Trim failed but continuing with original video: {e}")
                 else:
@@ -231,11 +232,13 @@ class AIService:
         video.queue_position = None
         await db.commit()
 
-        # Simulate progress updates
-        for progress in [25, 50, 75, 100]:
+        # Simulate progress updates; 100% is written with the completion
+        # commit below rather than as a separate round trip
+        for progress in [25, 50, 75]:
             await asyncio.sleep(self.VIDEO_GENERATION_TIME / 4)
             video.progress_percent = progress
             await db.commit()
+        await asyncio.sleep(self.VIDEO_GENERATION_TIME / 4)
 
         # Calculate mock duration based on text length
         # Rough estimate: ~150 characters per minute of speech
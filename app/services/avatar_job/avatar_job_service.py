@@ -2,10 +2,10 @@
 
 import os
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db_session
@@ -129,6 +129,42 @@ class AvatarJobService:
         )
         return result.scalar() or 0
 
+    async def get_queue_counts(self, db: AsyncSession) -> Dict[str, int]:
+        """
+        Get running, pending, completed-today and failed-today job counts.
+
+        All four counts come from a single aggregate query instead of one
+        round-trip each.
+        """
+        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        result = await db.execute(
+            select(
+                func.count(AvatarJob.id)
+                .filter(AvatarJob.status == JobStatus.PROCESSING.value)
+                .label("running"),
+                func.count(AvatarJob.id)
+                .filter(AvatarJob.status == JobStatus.PENDING.value)
+                .label("pending"),
+                func.count(AvatarJob.id)
+                .filter(
+                    and_(
+                        AvatarJob.status == JobStatus.COMPLETED.value,
+                        AvatarJob.completed_at >= today_start,
+                    )
+                )
+                .label("completed_today"),
+                func.count(AvatarJob.id)
+                .filter(
+                    and_(
+                        AvatarJob.status == JobStatus.FAILED.value,
+                        AvatarJob.completed_at >= today_start,
+                    )
+                )
+                .label("failed_today"),
+            )
+        )
+        return dict(result.one()._mapping)
+
     async def can_start_new_job(self, db: AsyncSession) -> bool:
         """Check if we can start a new job based on concurrent limit"""
         running = await self.get_running_count(db)
@@ -200,10 +236,24 @@ class AvatarJobService:
             await self.mark_failed(job.id, "Could not generate download URL", db)
             return False
 
-        # Update job status to processing
-        job.status = JobStatus.PROCESSING.value
-        job.started_at = datetime.utcnow()
-        job.attempts += 1
+        # Claim the job atomically: overlapping process_pending_jobs runs can
+        # pick up the same pending job, and only one of them may submit it to
+        # RunPod (otherwise the avatar is generated twice on the GPU)
+        claim = await db.execute(
+            update(AvatarJob)
+            .where(
+                AvatarJob.id == job.id,
+                AvatarJob.status == JobStatus.PENDING.value,
+            )
+            .values(
+                status=JobStatus.PROCESSING.value,
+                started_at=datetime.utcnow(),
+                attempts=AvatarJob.attempts + 1,
+            )
+        )
+        if claim.rowcount == 0:
+            logger.info(f"Job {job.id} already claimed by another worker, skipping")
+            return False
 
         # Update video model status
         video_model.status = ModelStatus.PROCESSING.value
@@ -7,6 +7,11 @@ import httpx
 
 from app.utils import logger
 
+# Connecting and waiting for a pooled connection should fail fast; only the
+# read phase gets the long budget (runsync blocks until the avatar is built)
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0, pool=5.0)
+RUNSYNC_TIMEOUT = httpx.Timeout(connect=5.0, read=300.0, write=30.0, pool=5.0)
+
 
 class RunPodResponse:
     """Response from RunPod avatar generation"""
@@ -34,6 +39,8 @@ class RunPodClient:
     def __init__(self):
         self._api_key: Optional[str] = None
         self._endpoint_id: Optional[str] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._headers: Optional[dict] = None
 
     @property
     def api_key(self) -> str:
@@ -51,11 +58,33 @@ class RunPodClient:
     def base_url(self) -> str:
         return f"https://api.runpod.ai/v2/{self.endpoint_id}"
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        A single long-lived client keeps connections to RunPod alive between
+        calls instead of paying a TCP/TLS handshake on every request.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=DEFAULT_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (called on application shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _get_headers(self) -> dict:
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        # The API key is fixed once loaded, so the headers are built only once
+        if self._headers is None:
+            self._headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+        return self._headers
 
     async def generate_avatar(
         self,
@@ -102,57 +131,58 @@ class RunPodClient:
             payload["input"]["options"] = options
 
         try:
-            async with httpx.AsyncClient(timeout=300.0) as client:
-                logger.info(
-                    f"Triggering RunPod avatar generation for {avatar_id}, "
-                    f"model={model}"
-                )
-
-                # Use runsync for synchronous execution
-                response = await client.post(
-                    f"{self.base_url}/runsync",
-                    headers=self._get_headers(),
-                    json=payload,
-                )
-
-                if response.status_code != 200:
-                    error_msg = f"RunPod API error: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    return RunPodResponse(success=False, error=error_msg)
-
-                data = response.json()
+            client = self._get_client()
+            logger.info(
+                f"Triggering RunPod avatar generation for {avatar_id}, "
+                f"model={model}"
+            )
 
-                # Check for RunPod-level errors
-                if data.get("status") == "FAILED":
-                    error_msg = data.get("error", "Unknown RunPod error")
-                    logger.error(f"RunPod job failed: {error_msg}")
-                    return RunPodResponse(
-                        success=False, error=error_msg, job_id=data.get("id")
-                    )
+            # Use runsync for synchronous execution
+            response = await client.post(
+                f"{self.base_url}/runsync",
+                headers=self._get_headers(),
+                json=payload,
+                timeout=RUNSYNC_TIMEOUT,
+            )
 
-                # Extract output from successful response
-                output = data.get("output", {})
+            if response.status_code != 200:
+                error_msg = f"RunPod API error: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                return RunPodResponse(success=False, error=error_msg)
 
-                if output.get("status") == "error":
-                    error_msg = output.get("error", "Avatar generation failed")
-                    logger.error(f"Avatar generation error: {error_msg}")
-                    return RunPodResponse(
-                        success=False, error=error_msg, job_id=data.get("id")
-                    )
+            data = response.json()
 
-                logger.info(
-                    f"Avatar generation successful for {avatar_id}, "
-                    f"frames={output.get('num_frames')}"
+            # Check for RunPod-level errors
+            if data.get("status") == "FAILED":
+                error_msg = data.get("error", "Unknown RunPod error")
+                logger.error(f"RunPod job failed: {error_msg}")
+                return RunPodResponse(
+                    success=False, error=error_msg, job_id=data.get("id")
                 )
 
+            # Extract output from successful response
+            output = data.get("output", {})
+
+            if output.get("status") == "error":
+                error_msg = output.get("error", "Avatar generation failed")
+                logger.error(f"Avatar generation error: {error_msg}")
                 return RunPodResponse(
-                    success=True,
-                    avatar_id=output.get("avatar_id"),
-                    upload_url=output.get("upload_url"),
-                    job_id=data.get("id"),
-                    num_frames=output.get("num_frames"),
+                    success=False, error=error_msg, job_id=data.get("id")
                 )
 
+            logger.info(
+                f"Avatar generation successful for {avatar_id}, "
+                f"frames={output.get('num_frames')}"
+            )
+
+            return RunPodResponse(
+                success=True,
+                avatar_id=output.get("avatar_id"),
+                upload_url=output.get("upload_url"),
+                job_id=data.get("id"),
+                num_frames=output.get("num_frames"),
+            )
+
         except httpx.TimeoutException:
             error_msg = "RunPod request timed out"
             logger.error(error_msg)
@@ -178,43 +208,43 @@ class RunPodClient:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/status/{job_id}",
-                    headers=self._get_headers(),
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/status/{job_id}",
+                headers=self._get_headers(),
+            )
+
+            if response.status_code != 200:
+                return RunPodResponse(
+                    success=False,
+                    error=f"Status check failed: {response.status_code}",
                 )
 
-                if response.status_code != 200:
-                    return RunPodResponse(
-                        success=False,
-                        error=f"Status check failed: {response.status_code}",
-                    )
-
-                data = response.json()
-                status = data.get("status")
-
-                if status == "COMPLETED":
-                    output = data.get("output", {})
-                    return RunPodResponse(
-                        success=True,
-                        avatar_id=output.get("avatar_id"),
-                        upload_url=output.get("upload_url"),
-                        job_id=job_id,
-                        num_frames=output.get("num_frames"),
-                    )
-                elif status == "FAILED":
-                    return RunPodResponse(
-                        success=False,
-                        error=data.get("error", "Job failed"),
-                        job_id=job_id,
-                    )
-                else:
-                    # Still processing
-                    return RunPodResponse(
-                        success=False,
-                        error=f"Job still {status}",
-                        job_id=job_id,
-                    )
+            data = response.json()
+            status = data.get("status")
+
+            if status == "COMPLETED":
+                output = data.get("output", {})
+                return RunPodResponse(
+                    success=True,
+                    avatar_id=output.get("avatar_id"),
+                    upload_url=output.get("upload_url"),
+                    job_id=job_id,
+                    num_frames=output.get("num_frames"),
+                )
+            elif status == "FAILED":
+                return RunPodResponse(
+                    success=False,
+                    error=data.get("error", "Job failed"),
+                    job_id=job_id,
+                )
+            else:
+                # Still processing
+                return RunPodResponse(
+                    success=False,
+                    error=f"Job still {status}",
+                    job_id=job_id,
+                )
 
         except Exception as e:
             return RunPodResponse(success=False, error=str(e))
@@ -5,21 +5,31 @@ from app.services.firebase.firebase_config import (
     initialize_firebase,
     is_firebase_initialized,
 )
+from app.services.firebase.firebase_keys import (
+    refresh_public_keys,
+    start_key_refresh,
+    stop_key_refresh,
+)
 from app.services.firebase.firebase_auth import (
     TokenData,
     get_current_user,
     get_current_user_or_create,
     get_optional_user,
     verify_token,
+    verify_token_coalesced,
 )
 
 __all__ = [
     "get_firebase_app",
     "initialize_firebase",
     "is_firebase_initialized",
+    "refresh_public_keys",
+    "start_key_refresh",
+    "stop_key_refresh",
     "TokenData",
     "get_current_user",
     "get_current_user_or_create",
     "get_optional_user",
     "verify_token",
+    "verify_token_coalesced",
 ]
@@ -1,22 +1,38 @@
 """Firebase authentication middleware and utilities"""
 
+import asyncio
+import hashlib
 import logging
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
+import jwt
 from fastapi import Depends, HTTPException, Request
 from firebase_admin import auth
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.db import get_db
 from app.models.user import User
-from app.services.firebase.firebase_config import get_firebase_app
+from app.services.firebase.firebase_keys import decode_id_token
 
 logger = logging.getLogger(__name__)
 
+BEARER_PREFIX = "Bearer "
+BEARER_PREFIX_LEN = len(BEARER_PREFIX)
 
-@dataclass
+# Relationships read by most authenticated routes. Loading them together with
+# the user avoids a separate lazy SELECT per relationship in every handler.
+_USER_EAGER_LOADS = (
+    selectinload(User.subscription),
+    selectinload(User.profile),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class TokenData:
     """Decoded Firebase token data"""
 
@@ -39,11 +55,13 @@ def verify_token(id_token: str) -> TokenData:
     Raises:
         HTTPException: If token verification fails
     """
-    # Ensure Firebase is initialized
-    get_firebase_app()
-
+    # Firebase is initialized once at application startup (see main.lifespan)
     try:
-        decoded_token = auth.verify_id_token(id_token)
+        # Verify locally against the cached signing keys; fall back to the
+        # Admin SDK when the key is not cached (e.g. right after a rotation)
+        decoded_token = decode_id_token(id_token)
+        if decoded_token is None:
+            decoded_token = auth.verify_id_token(id_token)
 
         return TokenData(
             uid=decoded_token["uid"],
@@ -51,17 +69,51 @@ def verify_token(id_token: str) -> TokenData:
             name=decoded_token.get("name"),
             email_verified=decoded_token.get("email_verified", False),
         )
-    except auth.ExpiredIdTokenError:
+    except (jwt.ExpiredSignatureError, auth.ExpiredIdTokenError):
         raise HTTPException(status_code=401, detail="Token has expired")
     except auth.RevokedIdTokenError:
         raise HTTPException(status_code=401, detail="Token has been revoked")
-    except auth.InvalidIdTokenError as e:
+    except (jwt.InvalidTokenError, auth.InvalidIdTokenError) as e:
         raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
     except Exception as e:
         logger.error(f"Token verification failed: {e}")
         raise HTTPException(status_code=401, detail="Authentication failed")
 
 
+# In-flight verifications keyed by token hash, so concurrent requests carrying
+# the same token share a single verification
+_inflight_verifications: dict[bytes, asyncio.Task] = {}
+
+
+async def verify_token_coalesced(id_token: str) -> TokenData:
+    """
+    Verify a Firebase ID token, sharing the work between concurrent callers.
+
+    The first caller for a token runs verify_token in a worker thread (the
+    Admin SDK fallback may block on network I/O); callers that arrive while
+    it is running await the same result instead of verifying again.
+
+    Args:
+        id_token: The Firebase ID token to verify
+
+    Returns:
+        TokenData: The decoded token data
+
+    Raises:
+        HTTPException: If token verification fails
+    """
+    key = hashlib.sha256(id_token.encode()).digest()
+
+    task = _inflight_verifications.get(key)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(verify_token, id_token))
+        _inflight_verifications[key] = task
+        task.add_done_callback(lambda _: _inflight_verifications.pop(key, None))
+
+    # Shield so one cancelled request does not cancel the shared verification
+    return await asyncio.shield(task)
+
+
 def get_token_from_header(request: Request) -> str:
     """
     Extract Bearer token from Authorization header.
@@ -82,12 +134,12 @@ def get_token_from_header(request: Request) -> str:
             status_code=401, detail="Authorization header missing"
         )
 
-    if not auth_header.startswith("Bearer "):
+    if not auth_header.startswith(BEARER_PREFIX):
         raise HTTPException(
             status_code=401, detail="Invalid authorization header format. Expected 'Bearer <token>'"
         )
 
-    return auth_header.split("Bearer ")[1]
+    return auth_header[BEARER_PREFIX_LEN:]
 
 
 async def get_current_user(
@@ -113,7 +165,7 @@ async def get_current_user(
         HTTPException: If authentication fails or user not found
     """
     token = get_token_from_header(request)
-    token_data = verify_token(token)
+    token_data = await verify_token_coalesced(token)
 
     if not token_data.email:
         raise HTTPException(
@@ -121,12 +173,20 @@ async def get_current_user(
         )
 
     # Look up user by Firebase UID
-    result = await db.execute(select(User).where(User.firebase_uid == token_data.uid))
+    result = await db.execute(
+        select(User)
+        .options(*_USER_EAGER_LOADS)
+        .where(User.firebase_uid == token_data.uid)
+    )
     user = result.scalar_one_or_none()
 
     if not user:
         # Check if user exists by email (could have been created differently)
-        result = await db.execute(select(User).where(User.email == token_data.email))
+        result = await db.execute(
+            select(User)
+            .options(*_USER_EAGER_LOADS)
+            .where(User.email == token_data.email)
+        )
         user = result.scalar_one_or_none()
 
         if user:
@@ -160,7 +220,7 @@ async def get_current_user_or_create(
         HTTPException: If authentication fails
     """
     token = get_token_from_header(request)
-    token_data = verify_token(token)
+    token_data = await verify_token_coalesced(token)
 
     if not token_data.email:
         raise HTTPException(
@@ -168,28 +228,34 @@ async def get_current_user_or_create(
         )
 
     # Look up user by Firebase UID
-    result = await db.execute(select(User).where(User.firebase_uid == token_data.uid))
+    result = await db.execute(
+        select(User)
+        .options(*_USER_EAGER_LOADS)
+        .where(User.firebase_uid == token_data.uid)
+    )
     user = result.scalar_one_or_none()
 
     if not user:
-        # Check if user exists by email
-        result = await db.execute(select(User).where(User.email == token_data.email))
-        user = result.scalar_one_or_none()
-
-        if user:
-            # Update firebase_uid if user exists but uid doesn't match
-            user.firebase_uid = token_data.uid
-        else:
-            # Create new user
-            user = User(
+        # Create the user, or relink an existing account with the same email
+        # to this Firebase UID, in a single INSERT ... ON CONFLICT statement
+        stmt = (
+            pg_insert(User)
+            .values(
                 firebase_uid=token_data.uid,
                 email=token_data.email,
                 name=token_data.name,
             )
-            db.add(user)
-
+            .on_conflict_do_update(
+                index_elements=[User.email],
+                set_={"firebase_uid": token_data.uid, "updated_at": datetime.utcnow()},
+            )
+            .returning(User)
+            .options(*_USER_EAGER_LOADS)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        user = result.scalar_one()
         await db.commit()
-        await db.refresh(user)
 
     return user
 
@@ -211,12 +277,12 @@ async def get_optional_user(
     """
     auth_header = request.headers.get("Authorization")
 
-    if not auth_header or not auth_header.startswith("Bearer "):
+    if not auth_header or not auth_header.startswith(BEARER_PREFIX):
         return None
 
     try:
-        token = auth_header.split("Bearer ")[1]
-        token_data = verify_token(token)
+        token = auth_header[BEARER_PREFIX_LEN:]
+        token_data = await verify_token_coalesced(token)
 
         if not token_data.email:
             return None
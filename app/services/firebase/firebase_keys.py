@@ -0,0 +1,138 @@
+"""Local verification of Firebase ID tokens against cached Google public keys"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+import jwt
+from cryptography.x509 import load_pem_x509_certificate
+
+logger = logging.getLogger(__name__)
+
+# x509 certificates Google uses to sign Firebase ID tokens
+GOOGLE_CERTS_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/"
+    "securetoken@system.gserviceaccount.com"
+)
+
+# How often the cached signing keys are refreshed (seconds)
+KEY_REFRESH_INTERVAL = 3600
+
+# Cached signing keys (kid -> RSA public key) and the project they verify for
+_public_keys: dict = {}
+_project_id: Optional[str] = None
+_refresh_task: Optional[asyncio.Task] = None
+
+
+async def refresh_public_keys() -> int:
+    """
+    Fetch Google's signing certificates and replace the cached key set.
+
+    Returns:
+        Number of keys loaded
+
+    Raises:
+        httpx.HTTPError: If the certificates cannot be fetched
+    """
+    global _public_keys
+
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        response = await client.get(GOOGLE_CERTS_URL)
+        response.raise_for_status()
+        certs = response.json()
+
+    _public_keys = {
+        kid: load_pem_x509_certificate(pem.encode()).public_key()
+        for kid, pem in certs.items()
+    }
+    logger.info(f"Loaded {len(_public_keys)} Firebase token signing keys")
+    return len(_public_keys)
+
+
+async def _refresh_loop() -> None:
+    """Periodically refresh the cached signing keys."""
+    while True:
+        await asyncio.sleep(KEY_REFRESH_INTERVAL)
+        try:
+            await refresh_public_keys()
+        except Exception as e:
+            logger.warning(f"Failed to refresh Firebase signing keys: {e}")
+
+
+async def start_key_refresh(project_id: Optional[str]) -> None:
+    """
+    Load the signing keys and start the hourly background refresh.
+
+    Should be called once at application startup. If the keys cannot be
+    loaded, tokens are still verified through the Firebase Admin SDK.
+
+    Args:
+        project_id: Firebase project ID expected as the token audience
+    """
+    global _project_id, _refresh_task
+
+    if not project_id:
+        logger.warning("Firebase project ID unknown, local token verification disabled")
+        return
+
+    _project_id = project_id
+
+    try:
+        await refresh_public_keys()
+    except Exception as e:
+        logger.warning(f"Failed to load Firebase signing keys: {e}")
+
+    if _refresh_task is None:
+        _refresh_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_key_refresh() -> None:
+    """Stop the background key refresh (called on application shutdown)."""
+    global _refresh_task
+
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
+
+
+def decode_id_token(id_token: str) -> Optional[dict]:
+    """
+    Verify a Firebase ID token locally with the cached signing keys.
+
+    Args:
+        id_token: The Firebase ID token to verify
+
+    Returns:
+        The decoded claims with 'uid' set, or None if the token's signing key
+        is not cached (the caller should fall back to the Firebase Admin SDK)
+
+    Raises:
+        jwt.ExpiredSignatureError: If the token has expired
+        jwt.InvalidTokenError: If the token is otherwise invalid
+    """
+    if _project_id is None or not _public_keys:
+        return None
+
+    key = _public_keys.get(jwt.get_unverified_header(id_token).get("kid"))
+    if key is None:
+        return None
+
+    claims = jwt.decode(
+        id_token,
+        key=key,
+        algorithms=["RS256"],
+        audience=_project_id,
+        issuer=f"https://securetoken.google.com/{_project_id}",
+        options={"require": ["exp", "iat", "sub"]},
+    )
+
+    if not claims["sub"]:
+        raise jwt.InvalidTokenError("Token has an empty subject")
+
+    claims["uid"] = claims["sub"]
+    return claims
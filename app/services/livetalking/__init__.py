@@ -4,10 +4,14 @@ from app.services.livetalking.livetalking_service import (
     LiveTalkingService,
     livetalking_service,
 )
-from app.services.livetalking.livetalking_config import LiveTalkingSettings
+from app.services.livetalking.livetalking_config import (
+    LiveTalkingSettings,
+    get_livetalking_settings,
+)
 
 __all__ = [
     "LiveTalkingService",
     "livetalking_service",
     "LiveTalkingSettings",
+    "get_livetalking_settings",
 ]
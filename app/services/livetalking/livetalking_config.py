@@ -1,6 +1,7 @@
 """LiveTalking service configuration"""
 
-import os
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -8,16 +9,22 @@ class LiveTalkingSettings(BaseSettings):
     """Settings for LiveTalking server connection"""
 
     # LiveTalking server URL (e.g., http://localhost:8010 or https://livetalking.example.com)
-    LIVETALKING_URL: str = os.getenv("LIVETALKING_URL", "http://localhost:8010")
+    LIVETALKING_URL: str = "http://localhost:8010"
 
     # Optional API key for securing communication between backends
-    LIVETALKING_API_KEY: str = os.getenv("LIVETALKING_API_KEY", "")
+    LIVETALKING_API_KEY: str = ""
 
     # Timeout for HTTP requests to LiveTalking (seconds)
-    LIVETALKING_TIMEOUT: int = int(os.getenv("LIVETALKING_TIMEOUT", "30"))
+    LIVETALKING_TIMEOUT: int = 30
 
     # Timeout for downloading recordings (seconds)
-    LIVETALKING_DOWNLOAD_TIMEOUT: int = int(os.getenv("LIVETALKING_DOWNLOAD_TIMEOUT", "120"))
+    LIVETALKING_DOWNLOAD_TIMEOUT: int = 120
 
     class Config:
         env_prefix = ""
+
+
+@lru_cache(maxsize=1)
+def get_livetalking_settings() -> LiveTalkingSettings:
+    """Get LiveTalking settings (read from the environment once and cached)."""
+    return LiveTalkingSettings()
@@ -1,49 +1,105 @@
 """LiveTalking service for real-time avatar streaming"""
 
+import asyncio
 import logging
-import tempfile
+import time
 from typing import Optional
-from io import BytesIO
 
 import httpx
 
-from app.services.livetalking.livetalking_config import LiveTalkingSettings
+from app.services.livetalking.livetalking_config import get_livetalking_settings
 from app.services.s3 import s3_service
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when streaming recordings out of LiveTalking
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Seconds a successful health probe is reused before LiveTalking is probed
+# again (failed probes are not cached, so recovery is seen immediately)
+HEALTH_CHECK_TTL = 10.0
+
+# Non-interrupting texts waiting to be sent before send_text applies backpressure
+SEND_QUEUE_SIZE = 256
+
 
 class LiveTalkingService:
     """Service for communicating with LiveTalking server"""
 
     def __init__(self):
-        self._settings = None
-
-    def _get_settings(self) -> LiveTalkingSettings:
-        """Get fresh settings from environment."""
-        if self._settings is None:
-            self._settings = LiveTalkingSettings()
-        return self._settings
+        self._client: Optional[httpx.AsyncClient] = None
+        self._base_url: Optional[str] = None
+        self._headers: Optional[dict] = None
+        # Expiry of the last successful health probe
+        self._healthy_until = 0.0
+        # Queued (session_id, epoch, text) sends and the worker draining them
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._send_worker: Optional[asyncio.Task] = None
+        # Bumped per session by interrupting sends; queued texts from an
+        # older epoch were superseded and are dropped instead of spoken
+        self._interrupt_epochs: dict[int, int] = {}
+        # Held for every POST to /human, so an interrupt waits for a queued
+        # text that is already being sent and then cuts it off
+        self._post_lock = asyncio.Lock()
+        # Last failure of a queued text per session, raised by the next send
+        self._send_errors: dict[int, str] = {}
 
     @property
     def base_url(self) -> str:
-        return self._get_settings().LIVETALKING_URL.rstrip("/")
+        # Settings are fixed once loaded, so the URL is normalised only once
+        if self._base_url is None:
+            self._base_url = get_livetalking_settings().LIVETALKING_URL.rstrip("/")
+        return self._base_url
 
     @property
     def timeout(self) -> int:
-        return self._get_settings().LIVETALKING_TIMEOUT
+        return get_livetalking_settings().LIVETALKING_TIMEOUT
 
     @property
     def download_timeout(self) -> int:
-        return self._get_settings().LIVETALKING_DOWNLOAD_TIMEOUT
+        return get_livetalking_settings().LIVETALKING_DOWNLOAD_TIMEOUT
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        A single long-lived client keeps connections to LiveTalking alive
+        between calls instead of opening a new one on every request. HTTP/2
+        is negotiated via ALPN on https URLs so session calls and recording
+        downloads can share one connection; plain http stays on HTTP/1.1.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Stop the send worker and close the HTTP client (called on application shutdown)"""
+        if self._send_worker is not None:
+            self._send_worker.cancel()
+            try:
+                await self._send_worker
+            except asyncio.CancelledError:
+                pass
+            self._send_worker = None
+            self._send_queue = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _get_headers(self) -> dict:
-        """Get headers for LiveTalking requests."""
-        headers = {"Content-Type": "application/json"}
-        api_key = self._get_settings().LIVETALKING_API_KEY
-        if api_key:
-            headers["X-API-Key"] = api_key
-        return headers
+        """Get headers for LiveTalking requests (built once and reused)."""
+        if self._headers is None:
+            headers = {"Content-Type": "application/json"}
+            api_key = get_livetalking_settings().LIVETALKING_API_KEY
+            if api_key:
+                headers["X-API-Key"] = api_key
+            self._headers = headers
+        return self._headers
 
     async def create_session(self) -> dict:
         """
@@ -56,50 +112,104 @@ class LiveTalkingService:
         Returns:
             dict with session_id and webrtc_url for frontend connection
         """
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Get the offer endpoint URL - frontend will use this
-                webrtc_url = f"{self.base_url}/offer"
-
-                logger.info(f"Created LiveTalking session reference, WebRTC URL: {webrtc_url}")
+        # Get the offer endpoint URL - frontend will use this
+        webrtc_url = f"{self.base_url}/offer"
 
-                return {
-                    "webrtc_url": webrtc_url,
-                    "human_url": f"{self.base_url}/human",
-                    "record_url": f"{self.base_url}/record",
-                }
+        logger.info(f"Created LiveTalking session reference, WebRTC URL: {webrtc_url}")
 
-        except httpx.RequestError as e:
-            logger.error(f"Failed to connect to LiveTalking server: {e}")
-            raise ConnectionError(f"LiveTalking server unavailable: {e}")
+        return {
+            "webrtc_url": webrtc_url,
+            "human_url": f"{self.base_url}/human",
+            "record_url": f"{self.base_url}/record",
+        }
 
     async def send_text(self, session_id: int, text: str, interrupt: bool = True) -> bool:
         """
         Send text to LiveTalking for TTS processing.
 
+        Interrupting texts are sent immediately so the caller learns whether
+        they reached LiveTalking; they also discard any still-queued texts for
+        the session and are sent after a queued text already in flight, so
+        that text is cut off rather than spoken afterwards. Non-interrupting
+        texts are queued and sent in order by a background worker, so the
+        caller does not wait for the round trip.
+
         Args:
             session_id: The WebRTC session ID
             text: Text to speak
             interrupt: Whether to interrupt current speech
 
         Returns:
-            True if successful
+            True if the text was sent, False if it was queued
+
+        Raises:
+            ConnectionError: If LiveTalking is unreachable, or a previously
+                queued text for the session could not be sent
         """
+        if interrupt:
+            # Failures of superseded texts no longer matter
+            self._send_errors.pop(session_id, None)
+            if self._send_queue is not None:
+                self._interrupt_epochs[session_id] = self._interrupt_epochs.get(session_id, 0) + 1
+            async with self._post_lock:
+                return await self._post_text(session_id, text, interrupt=True)
+
+        error = self._send_errors.pop(session_id, None)
+        if error is not None:
+            raise ConnectionError(f"Failed to send queued text: {error}")
+
+        epoch = self._interrupt_epochs.get(session_id, 0)
+        await self._get_send_queue().put((session_id, epoch, text))
+        return False
+
+    async def flush(self) -> None:
+        """Wait until every queued text has been sent."""
+        if self._send_queue is not None:
+            await self._send_queue.join()
+
+    def _get_send_queue(self) -> asyncio.Queue:
+        """Get the send queue, starting its worker on first use."""
+        if self._send_queue is None:
+            self._send_queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+            self._send_worker = asyncio.create_task(self._drain_send_queue())
+        return self._send_queue
+
+    async def _drain_send_queue(self) -> None:
+        """Send queued texts one at a time, preserving their order."""
+        queue = self._send_queue
+        while True:
+            session_id, epoch, text = await queue.get()
+            try:
+                async with self._post_lock:
+                    # Checked under the lock: an interrupt may have been sent
+                    # while this text waited for it
+                    if epoch == self._interrupt_epochs.get(session_id, 0):
+                        await self._post_text(session_id, text, interrupt=False)
+            except Exception as e:
+                logger.error(f"Queued text for LiveTalking session {session_id} failed: {e}")
+                self._send_errors[session_id] = str(e)
+            finally:
+                queue.task_done()
+                # Nothing queued can be stale any more, so the epochs can reset
+                if queue.empty():
+                    self._interrupt_epochs.clear()
+
+    async def _post_text(self, session_id: int, text: str, interrupt: bool) -> bool:
+        """POST a text to LiveTalking's /human endpoint."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/human",
-                    headers=self._get_headers(),
-                    json={
-                        "text": text,
-                        "type": "echo",
-                        "interrupt": interrupt,
-                        "sessionid": session_id,
-                    },
-                )
-                response.raise_for_status()
-                logger.info(f"Sent text to LiveTalking session {session_id}: {text[:50]}...")
-                return True
+            client = self._get_client()
+            response = await client.post(
+                "/human",
+                json={
+                    "text": text,
+                    "type": "echo",
+                    "interrupt": interrupt,
+                    "sessionid": session_id,
+                },
+            )
+            response.raise_for_status()
+            logger.info(f"Sent text to LiveTalking session {session_id}: {text[:50]}...")
+            return True
 
         except httpx.RequestError as e:
             logger.error(f"Failed to send text to LiveTalking: {e}")
@@ -116,18 +226,17 @@ class LiveTalkingService:
             True if recording started successfully
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/record",
-                    headers=self._get_headers(),
-                    json={
-                        "type": "start_record",
-                        "sessionid": session_id,
-                    },
-                )
-                response.raise_for_status()
-                logger.info(f"Started recording for LiveTalking session {session_id}")
-                return True
+            client = self._get_client()
+            response = await client.post(
+                "/record",
+                json={
+                    "type": "start_record",
+                    "sessionid": session_id,
+                },
+            )
+            response.raise_for_status()
+            logger.info(f"Started recording for LiveTalking session {session_id}")
+            return True
 
         except httpx.RequestError as e:
             logger.error(f"Failed to start recording: {e}")
@@ -144,53 +253,22 @@ class LiveTalkingService:
             True if recording stopped successfully
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/record",
-                    headers=self._get_headers(),
-                    json={
-                        "type": "end_record",
-                        "sessionid": session_id,
-                    },
-                )
-                response.raise_for_status()
-                logger.info(f"Stopped recording for LiveTalking session {session_id}")
-                return True
+            client = self._get_client()
+            response = await client.post(
+                "/record",
+                json={
+                    "type": "end_record",
+                    "sessionid": session_id,
+                },
+            )
+            response.raise_for_status()
+            logger.info(f"Stopped recording for LiveTalking session {session_id}")
+            return True
 
         except httpx.RequestError as e:
             logger.error(f"Failed to stop recording: {e}")
             raise ConnectionError(f"Failed to stop recording: {e}")
 
-    async def download_recording(self, filename: str = "record_lasted.mp4") -> Optional[bytes]:
-        """
-        Download a recording from LiveTalking server.
-
-        Args:
-            filename: Name of the recording file
-
-        Returns:
-            Recording bytes if successful, None otherwise
-        """
-        try:
-            async with httpx.AsyncClient(timeout=self.download_timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/{filename}",
-                    headers=self._get_headers(),
-                )
-                response.raise_for_status()
-                logger.info(f"Downloaded recording: {filename} ({len(response.content)} bytes)")
-                return response.content
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                logger.warning(f"Recording not found: {filename}")
-                return None
-            logger.error(f"Failed to download recording: {e}")
-            raise
-        except httpx.RequestError as e:
-            logger.error(f"Failed to download recording: {e}")
-            raise ConnectionError(f"Failed to download recording: {e}")
-
     async def download_and_upload_to_s3(
         self,
         user_id: str,
@@ -200,6 +278,9 @@ class LiveTalkingService:
         """
         Download recording from LiveTalking and upload to S3.
 
+        The recording is streamed from LiveTalking into an S3 multipart
+        upload, so it never touches local disk.
+
         Args:
             user_id: User ID for S3 path
             recording_id: Unique ID for the recording
@@ -208,10 +289,6 @@ class LiveTalkingService:
         Returns:
             S3 presigned URL for the recording, or None if failed
         """
-        recording_bytes = await self.download_recording(filename)
-        if not recording_bytes:
-            return None
-
         # Generate S3 key
         s3_key = s3_service.generate_s3_key(
             user_id=user_id,
@@ -219,13 +296,31 @@ class LiveTalkingService:
             media_type="avatar-recordings",
         )
 
-        # Upload to S3
-        file_obj = BytesIO(recording_bytes)
-        await s3_service.upload_fileobj(
-            file_obj=file_obj,
-            s3_key=s3_key,
-            content_type="video/mp4",
-        )
+        try:
+            client = self._get_client()
+            async with client.stream(
+                "GET",
+                f"/{filename}",
+                timeout=self.download_timeout,
+            ) as response:
+                if response.status_code == 404:
+                    logger.warning(f"Recording not found: {filename}")
+                    return None
+                response.raise_for_status()
+
+                # Pipe the recording straight into S3 without a local copy
+                await s3_service.upload_stream(
+                    response.aiter_bytes(DOWNLOAD_CHUNK_SIZE),
+                    s3_key,
+                    content_type="video/mp4",
+                )
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to download recording: {e}")
+            raise
+        except httpx.RequestError as e:
+            logger.error(f"Failed to download recording: {e}")
+            raise ConnectionError(f"Failed to download recording: {e}")
 
         # Generate presigned URL
         url = await s3_service.generate_presigned_url(s3_key)
@@ -236,15 +331,30 @@ class LiveTalkingService:
         """
         Check if LiveTalking server is reachable.
 
+        A healthy result is reused for HEALTH_CHECK_TTL seconds, so a
+        frequently polled health endpoint does not probe the server on every
+        request. Unhealthy results are not cached.
+
         Returns:
             True if server is healthy
         """
+        if time.monotonic() < self._healthy_until:
+            return True
+
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(f"{self.base_url}/")
-                return response.status_code == 200
+            client = self._get_client()
+            # HEAD avoids transferring the index page; fall back to GET for
+            # servers that do not route HEAD
+            response = await client.head("/", timeout=5)
+            if response.status_code == 405:
+                response = await client.get("/", timeout=5)
+            healthy = response.status_code == 200
         except Exception:
-            return False
+            healthy = False
+
+        if healthy:
+            self._healthy_until = time.monotonic() + HEALTH_CHECK_TTL
+        return healthy
 
 
 # Create singleton instance
@@ -1,5 +1,7 @@
 """AWS S3 configuration for media storage"""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -13,10 +15,18 @@ class S3Settings(BaseSettings):
     PRESIGNED_URL_EXPIRATION: int = 3600  # 1 hour in seconds (default)
     VIDEO_STREAMING_EXPIRATION: int = 21600  # 6 hours for video streaming
     UPLOAD_TIMEOUT: int = 300  # 5 minutes in seconds
+    MAX_POOL_CONNECTIONS: int = 64  # Connections shared by concurrent S3 operations
+    MULTIPART_THRESHOLD: int = 32 * 1024 * 1024  # Files from 32 MB use multipart upload
+    MULTIPART_PART_SIZE: int = 16 * 1024 * 1024  # 16 MB parts (S3 minimum is 5 MB)
+    MULTIPART_CONCURRENCY: int = 8  # Parts of one upload sent in parallel
+    DOWNLOAD_PART_SIZE: int = 16 * 1024 * 1024  # Byte range fetched per GET
+    DOWNLOAD_CONCURRENCY: int = 8  # Ranges of one download fetched in parallel
 
     class Config:
         env_prefix = "S3_"
 
 
-# Initialize settings
-s3_settings = S3Settings()
+@lru_cache(maxsize=1)
+def get_s3_settings() -> S3Settings:
+    """Get S3 settings (read from the environment once and cached)."""
+    return S3Settings()
@@ -1,17 +1,75 @@
 """S3 service for uploading and managing media files"""
 
+import asyncio
 import logging
 import os
-from typing import Optional
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import AsyncIterable, Optional
+from urllib.parse import quote
+from uuid import uuid4
 
 import aioboto3
+import aiofiles.os
+from botocore.auth import S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from app.services.s3.s3_config import S3Settings
+from app.services.s3.s3_config import S3Settings, get_s3_settings
 
 logger = logging.getLogger(__name__)
 
+# Downloaded ranges are written to disk in pieces of this size as they
+# arrive, so memory use does not grow with the part size
+DOWNLOAD_WRITE_CHUNK_SIZE = 1024 * 1024
+
+# Presigned GET URLs are reused only during the first 10% of their lifetime,
+# so callers always receive at least 90% of the validity they asked for
+PRESIGNED_URL_REUSE_FRACTION = 0.1
+PRESIGNED_URL_CACHE_MAX_SIZE = 4096
+
+# Object metadata from HEAD requests is reused for a few seconds. Only
+# existing objects are cached, so a key uploaded through a presigned URL is
+# visible as soon as the client confirms the upload.
+STAT_CACHE_TTL = 5.0
+STAT_CACHE_MAX_SIZE = 4096
+
+# MIME types by file extension for uploads without an explicit content type
+_CONTENT_TYPES = MappingProxyType(
+    {
+        ".mp4": "video/mp4",
+        ".webm": "video/webm",
+        ".avi": "video/x-msvideo",
+        ".mov": "video/quicktime",
+        ".mkv": "video/x-matroska",
+        ".mp3": "audio/mpeg",
+        ".wav": "audio/wav",
+        ".m4a": "audio/mp4",
+        ".ogg": "audio/ogg",
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+        ".png": "image/png",
+        ".gif": "image/gif",
+        ".webp": "image/webp",
+        ".pdf": "application/pdf",
+        ".json": "application/json",
+    }
+)
+
+# Media served with a long-lived Cache-Control header
+_STREAMING_CONTENT_TYPE_PREFIXES = ("video/", "audio/")
+
+
+@dataclass(slots=True, frozen=True)
+class ObjectStat:
+    """Metadata of an S3 object returned by a HEAD request"""
+
+    size: int
+    etag: str
+    content_type: Optional[str]
+
 
 class S3Service:
     """Service for managing S3 operations for media files"""
@@ -20,14 +78,39 @@ class S3Service:
         """Initialize S3 service - credentials are loaded lazily on first use"""
         self._session = None
         self._config = None
+        # Long-lived S3 client, entered once and reused by every operation
+        self._client = None
+        self._client_cm = None
+        self._client_session = None
+        self._client_lock = asyncio.Lock()
+        # Caps S3 requests in flight across all operations at the client's
+        # pool size, so fan-outs queue here instead of inside the pool
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        # Credentials of the shared client and the object URL prefix per
+        # bucket, used to sign GET URLs without the client's request pipeline
+        self._presign_credentials = None
+        self._presign_url_prefixes: dict[str, str] = {}
+        # (bucket, s3_key, expiration) -> (url, reuse_until)
+        self._presigned_urls: dict[tuple[str, str, int], tuple[str, float]] = {}
+        # (bucket, s3_key) -> (stat, expires_at), and HEAD requests in flight
+        self._stats: dict[tuple[str, str], tuple[ObjectStat, float]] = {}
+        self._stat_requests: dict[tuple[str, str], asyncio.Task] = {}
 
     def _get_settings(self) -> S3Settings:
-        """Get fresh settings from environment.
+        """Get settings from environment.
+
+        Settings are read on first use, not at import time when env vars may
+        not be loaded yet, and cached afterwards.
+        """
+        return get_s3_settings()
+
+    def refresh_settings(self) -> None:
+        """Re-read settings from the environment on next use.
 
-        This ensures settings are read at usage time, not at import time
-        when env vars may not be loaded yet.
+        The session and client are rebuilt automatically if the access key
+        has changed.
         """
-        return S3Settings()
+        get_s3_settings.cache_clear()
 
     def _get_session(self):
         """Get or create aioboto3 session with current credentials.
@@ -48,10 +131,16 @@ class S3Service:
                 region_name=region,
             )
             self._cached_access_key = access_key
+            # URLs signed with the previous credentials must not be handed out
+            self._presigned_urls.clear()
             self._config = Config(
                 region_name=region,
                 signature_version="s3v4",
                 retries={"max_attempts": 3, "mode": "adaptive"},
+                # The client is shared by all requests, so size its pool for
+                # concurrent transfers and keep idle connections alive
+                max_pool_connections=settings.MAX_POOL_CONNECTIONS,
+                tcp_keepalive=True,
             )
             logger.info(
                 f"S3 session initialized with access key: {access_key[:8]}..."
@@ -61,6 +150,42 @@ class S3Service:
 
         return self._session, self._config
 
+    async def _get_client(self):
+        """Get the shared S3 client, creating it on first use.
+
+        Entering an aioboto3 client builds the botocore client and its
+        connection pool, so it is done once and kept open instead of on every
+        call. The client is recreated if the credentials change.
+        """
+        session, config = self._get_session()
+        if self._client is not None and self._client_session is session:
+            return self._client
+
+        async with self._client_lock:
+            if self._client is None or self._client_session is not session:
+                await self._close_client()
+                client_cm = session.client("s3", config=config)
+                self._client = await client_cm.__aenter__()
+                self._client_cm = client_cm
+                self._client_session = session
+                self._request_slots = asyncio.Semaphore(config.max_pool_connections)
+                self._presign_credentials = await session.get_credentials()
+                self._presign_url_prefixes.clear()
+            return self._client
+
+    async def _close_client(self) -> None:
+        if self._client_cm is not None:
+            client_cm = self._client_cm
+            self._client = None
+            self._client_cm = None
+            self._client_session = None
+            await client_cm.__aexit__(None, None, None)
+
+    async def aclose(self) -> None:
+        """Close the shared S3 client (called on application shutdown)"""
+        async with self._client_lock:
+            await self._close_client()
+
     @property
     def region(self) -> str:
         return self._get_settings().AWS_REGION
@@ -100,7 +225,7 @@ class S3Service:
             FileNotFoundError: If the local file does not exist
             ClientError: If S3 upload fails
         """
-        if not os.path.exists(file_path):
+        if not await aiofiles.os.path.exists(file_path):
             logger.error(f"File not found: {file_path}")
             raise FileNotFoundError(f"File not found: {file_path}")
 
@@ -109,29 +234,37 @@ class S3Service:
             content_type = self._get_content_type(file_path)
 
         try:
-            session, config = self._get_session()
-            async with session.client("s3", config=config) as s3_client:
-                extra_args = {"ContentType": content_type}
+            s3_client = await self._get_client()
+            extra_args = {"ContentType": content_type}
 
-                # Add cache control for video streaming
-                if content_type.startswith("video/") or content_type.startswith("audio/"):
-                    extra_args["CacheControl"] = "max-age=31536000"  # 1 year
+            # Add cache control for video streaming
+            if content_type.startswith(_STREAMING_CONTENT_TYPE_PREFIXES):
+                extra_args["CacheControl"] = "max-age=31536000"  # 1 year
 
-                # Set storage class if specified
-                if storage_class:
-                    extra_args["StorageClass"] = storage_class
+            # Set storage class if specified
+            if storage_class:
+                extra_args["StorageClass"] = storage_class
 
-                logger.info(
-                    f"Uploading file {file_path} to s3://{self.bucket_name}/{s3_key}"
-                    + (f" (StorageClass: {storage_class})" if storage_class else "")
-                )
+            logger.info(
+                f"Uploading file {file_path} to s3://{self.bucket_name}/{s3_key}"
+                + (f" (StorageClass: {storage_class})" if storage_class else "")
+            )
 
-                await s3_client.upload_file(
-                    file_path, self.bucket_name, s3_key, ExtraArgs=extra_args
+            settings = self._get_settings()
+            file_size = await aiofiles.os.path.getsize(file_path)
+            if file_size < settings.MULTIPART_THRESHOLD:
+                async with self._request_slots:
+                    await s3_client.upload_file(
+                        file_path, self.bucket_name, s3_key, ExtraArgs=extra_args
+                    )
+            else:
+                await self._upload_file_multipart(
+                    s3_client, file_path, file_size, s3_key, extra_args, settings
                 )
 
-                logger.info(f"Successfully uploaded {s3_key} to S3")
-                return True
+            self._invalidate_stat(s3_key)
+            logger.info(f"Successfully uploaded {s3_key} to S3")
+            return True
 
         except ClientError as e:
             logger.error(f"Failed to upload {file_path} to S3: {e}", exc_info=True)
@@ -140,6 +273,81 @@ class S3Service:
             logger.error(f"Unexpected error uploading {file_path} to S3: {e}", exc_info=True)
             raise
 
+    async def _upload_file_multipart(
+        self,
+        s3_client,
+        file_path: str,
+        file_size: int,
+        s3_key: str,
+        extra_args: dict,
+        settings: S3Settings,
+    ) -> None:
+        """
+        Upload a large local file as a multipart upload with parallel parts.
+
+        Each part is read from its own offset only once a slot is free, so at
+        most MULTIPART_CONCURRENCY parts are held in memory. The upload is
+        aborted if any part fails.
+
+        The file is opened once and parts are read with positional pread
+        calls in worker threads, so disk reads for upcoming parts overlap
+        with network sends of earlier ones.
+        """
+        bucket = self.bucket_name
+        part_size = settings.MULTIPART_PART_SIZE
+        slots = asyncio.Semaphore(settings.MULTIPART_CONCURRENCY)
+
+        fd = await asyncio.to_thread(os.open, file_path, os.O_RDONLY)
+        try:
+            if hasattr(os, "posix_fadvise"):
+                # Let the kernel read ahead aggressively for the whole file
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            async with self._request_slots:
+                upload = await s3_client.create_multipart_upload(
+                    Bucket=bucket, Key=s3_key, **extra_args
+                )
+            upload_id = upload["UploadId"]
+
+            async def upload_part(part_number: int, offset: int) -> dict:
+                async with slots:
+                    body = await asyncio.to_thread(os.pread, fd, part_size, offset)
+                    async with self._request_slots:
+                        response = await s3_client.upload_part(
+                            Bucket=bucket,
+                            Key=s3_key,
+                            UploadId=upload_id,
+                            PartNumber=part_number,
+                            Body=body,
+                        )
+                    return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+            part_tasks = [
+                asyncio.create_task(upload_part(part_number, offset))
+                for part_number, offset in enumerate(range(0, file_size, part_size), start=1)
+            ]
+
+            try:
+                parts = await asyncio.gather(*part_tasks)
+                async with self._request_slots:
+                    await s3_client.complete_multipart_upload(
+                        Bucket=bucket,
+                        Key=s3_key,
+                        UploadId=upload_id,
+                        MultipartUpload={"Parts": parts},
+                    )
+            except BaseException:
+                for task in part_tasks:
+                    task.cancel()
+                await asyncio.gather(*part_tasks, return_exceptions=True)
+                async with self._request_slots:
+                    await s3_client.abort_multipart_upload(
+                        Bucket=bucket, Key=s3_key, UploadId=upload_id
+                    )
+                raise
+        finally:
+            os.close(fd)
+
     async def upload_fileobj(
         self,
         file_obj,
@@ -163,28 +371,29 @@ class S3Service:
             ClientError: If S3 upload fails
         """
         try:
-            session, config = self._get_session()
-            async with session.client("s3", config=config) as s3_client:
-                extra_args = {}
+            s3_client = await self._get_client()
+            extra_args = {}
 
-                if content_type:
-                    extra_args["ContentType"] = content_type
-                    # Add cache control for video streaming
-                    if content_type.startswith("video/") or content_type.startswith("audio/"):
-                        extra_args["CacheControl"] = "max-age=31536000"  # 1 year
+            if content_type:
+                extra_args["ContentType"] = content_type
+                # Add cache control for video streaming
+                if content_type.startswith(_STREAMING_CONTENT_TYPE_PREFIXES):
+                    extra_args["CacheControl"] = "max-age=31536000"  # 1 year
 
-                # Set storage class if specified
-                if storage_class:
-                    extra_args["StorageClass"] = storage_class
+            # Set storage class if specified
+            if storage_class:
+                extra_args["StorageClass"] = storage_class
 
-                logger.info(f"Uploading file object to s3://{self.bucket_name}/{s3_key}")
+            logger.info(f"Uploading file object to s3://{self.bucket_name}/{s3_key}")
 
+            async with self._request_slots:
                 await s3_client.upload_fileobj(
                     file_obj, self.bucket_name, s3_key, ExtraArgs=extra_args if extra_args else None
                 )
 
-                logger.info(f"Successfully uploaded {s3_key} to S3")
-                return True
+            self._invalidate_stat(s3_key)
+            logger.info(f"Successfully uploaded {s3_key} to S3")
+            return True
 
         except ClientError as e:
             logger.error(f"Failed to upload file object to S3: {e}", exc_info=True)
@@ -193,12 +402,175 @@ class S3Service:
             logger.error(f"Unexpected error uploading file object to S3: {e}", exc_info=True)
             raise
 
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        s3_key: str,
+        content_type: Optional[str] = None,
+        storage_class: Optional[str] = None,
+    ) -> int:
+        """
+        Upload a stream of bytes of unknown length to S3 as a multipart upload.
+
+        Parts are sent as soon as enough data has arrived, with up to
+        MULTIPART_CONCURRENCY parts in flight, so the object is never written
+        to local disk or held in memory as a whole. Streams shorter than one
+        part are sent with a single PUT instead. The upload is aborted if
+        the stream or any part fails.
+
+        Args:
+            chunks: Async iterable producing the object's bytes
+            s3_key: S3 key (path) where the file will be stored
+            content_type: MIME type of the file
+            storage_class: S3 storage class (STANDARD, STANDARD_IA, GLACIER, etc.)
+
+        Returns:
+            Number of bytes uploaded
+
+        Raises:
+            ClientError: If S3 upload fails
+        """
+        bucket = self.bucket_name
+        settings = self._get_settings()
+        part_size = settings.MULTIPART_PART_SIZE
+        s3_client = await self._get_client()
+        extra_args = {}
+
+        if content_type:
+            extra_args["ContentType"] = content_type
+            # Add cache control for video streaming
+            if content_type.startswith(_STREAMING_CONTENT_TYPE_PREFIXES):
+                extra_args["CacheControl"] = "max-age=31536000"  # 1 year
+
+        # Set storage class if specified
+        if storage_class:
+            extra_args["StorageClass"] = storage_class
+
+        logger.info(f"Streaming upload to s3://{bucket}/{s3_key}")
+
+        # The multipart upload is only started once a full part has arrived
+        upload_id: Optional[str] = None
+        slots = asyncio.Semaphore(settings.MULTIPART_CONCURRENCY)
+        part_tasks: list[asyncio.Task] = []
+        part_errors: list[BaseException] = []
+        total = 0
+
+        async def upload_part(part_number: int, body: bytes) -> dict:
+            try:
+                async with self._request_slots:
+                    response = await s3_client.upload_part(
+                        Bucket=bucket,
+                        Key=s3_key,
+                        UploadId=upload_id,
+                        PartNumber=part_number,
+                        Body=body,
+                    )
+                return {"PartNumber": part_number, "ETag": response["ETag"]}
+            except BaseException as e:
+                part_errors.append(e)
+                raise
+            finally:
+                slots.release()
+
+        async def submit_part(body: bytes) -> None:
+            nonlocal upload_id
+            if upload_id is None:
+                async with self._request_slots:
+                    upload = await s3_client.create_multipart_upload(
+                        Bucket=bucket, Key=s3_key, **extra_args
+                    )
+                upload_id = upload["UploadId"]
+
+            # Wait for a free slot so memory stays bounded, and stop
+            # reading the stream as soon as any part has failed
+            await slots.acquire()
+            if part_errors:
+                slots.release()
+                raise part_errors[0]
+            part_tasks.append(
+                asyncio.create_task(upload_part(len(part_tasks) + 1, body))
+            )
+
+        try:
+            buffer = bytearray()
+            async for chunk in chunks:
+                buffer += chunk
+                total += len(chunk)
+                if len(buffer) >= part_size:
+                    await submit_part(bytes(buffer))
+                    buffer.clear()
+
+            if upload_id is None:
+                # The whole stream fits in one part
+                async with self._request_slots:
+                    await s3_client.put_object(
+                        Bucket=bucket, Key=s3_key, Body=bytes(buffer), **extra_args
+                    )
+            else:
+                # The final part may be smaller than the minimum
+                if buffer:
+                    await submit_part(bytes(buffer))
+
+                # gather keeps submission order, i.e. ascending part numbers
+                parts = await asyncio.gather(*part_tasks)
+
+                async with self._request_slots:
+                    await s3_client.complete_multipart_upload(
+                        Bucket=bucket,
+                        Key=s3_key,
+                        UploadId=upload_id,
+                        MultipartUpload={"Parts": parts},
+                    )
+        except BaseException as e:
+            logger.error(f"Failed to stream upload to {s3_key}: {e}", exc_info=True)
+            for task in part_tasks:
+                task.cancel()
+            await asyncio.gather(*part_tasks, return_exceptions=True)
+            if upload_id is not None:
+                async with self._request_slots:
+                    await s3_client.abort_multipart_upload(
+                        Bucket=bucket, Key=s3_key, UploadId=upload_id
+                    )
+            raise
+
+        self._invalidate_stat(s3_key)
+        logger.info(f"Successfully uploaded {s3_key} to S3 ({total} bytes)")
+        return total
+
+    def _get_cached_presigned_url(self, cache_key: tuple[str, str, int]) -> Optional[str]:
+        """Return a recently signed URL for the same object and expiration, if any."""
+        entry = self._presigned_urls.get(cache_key)
+        if entry is None:
+            return None
+
+        url, reuse_until = entry
+        if time.monotonic() >= reuse_until:
+            self._presigned_urls.pop(cache_key, None)
+            return None
+
+        return url
+
+    def _cache_presigned_url(
+        self, cache_key: tuple[str, str, int], url: str, expiration: int
+    ) -> None:
+        """Remember a signed URL for the reuse window of its lifetime."""
+        self._presigned_urls.pop(cache_key, None)
+        if len(self._presigned_urls) >= PRESIGNED_URL_CACHE_MAX_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            self._presigned_urls.pop(next(iter(self._presigned_urls)))
+        reuse_until = time.monotonic() + expiration * PRESIGNED_URL_REUSE_FRACTION
+        self._presigned_urls[cache_key] = (url, reuse_until)
+
     async def generate_presigned_url(
         self, s3_key: str, expiration: Optional[int] = None
     ) -> Optional[str]:
         """
         Generate a pre-signed URL for accessing a file from S3
 
+        URLs are reused for repeated requests of the same object while at
+        least 90% of their lifetime remains, so listing endpoints that sign
+        the same keys on every call skip the S3 client entirely.
+
         Args:
             s3_key: S3 key of the file
             expiration: URL expiration time in seconds (uses default if not provided)
@@ -210,17 +582,20 @@ class S3Service:
             expiration = self.presigned_url_expiration
 
         try:
-            session, config = self._get_session()
-            async with session.client("s3", config=config) as s3_client:
-                url = await s3_client.generate_presigned_url(
-                    "get_object",
-                    Params={"Bucket": self.bucket_name, "Key": s3_key},
-                    ExpiresIn=expiration,
-                )
-
-                logger.debug(f"Generated pre-signed URL for {s3_key}")
+            # Resolve the client first: it drops cached URLs if credentials rotated
+            s3_client = await self._get_client()
+            bucket = self.bucket_name
+            cache_key = (bucket, s3_key, expiration)
+            url = self._get_cached_presigned_url(cache_key)
+            if url is not None:
                 return url
 
+            url = await self._sign_get_url(s3_client, bucket, s3_key, expiration)
+
+            self._cache_presigned_url(cache_key, url, expiration)
+            logger.debug(f"Generated pre-signed URL for {s3_key}")
+            return url
+
         except ClientError as e:
             logger.error(f"Failed to generate pre-signed URL for {s3_key}: {e}", exc_info=True)
             return None
@@ -231,6 +606,35 @@ class S3Service:
             )
             return None
 
+    async def _sign_get_url(
+        self, s3_client, bucket: str, s3_key: str, expiration: int
+    ) -> str:
+        """Sign a GET URL, skipping endpoint resolution after the first call.
+
+        Most of the cost of the client's generate_presigned_url is resolving
+        the endpoint ruleset, which gives the same result for every key in a
+        bucket. The first URL for a bucket is signed by the client and its
+        prefix (scheme, host and any bucket path) is remembered. Later URLs
+        are signed directly with SigV4 query auth on that prefix.
+        """
+        quoted_key = quote(s3_key, safe="/~")
+        prefix = self._presign_url_prefixes.get(bucket)
+        if prefix is None or self._presign_credentials is None:
+            url = await s3_client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": bucket, "Key": s3_key},
+                ExpiresIn=expiration,
+            )
+            base = url.split("?", 1)[0]
+            if self._presign_credentials is not None and base.endswith(quoted_key):
+                self._presign_url_prefixes[bucket] = base[: len(base) - len(quoted_key)]
+            return url
+
+        credentials = await self._presign_credentials.get_frozen_credentials()
+        request = AWSRequest(method="GET", url=prefix + quoted_key)
+        S3SigV4QueryAuth(credentials, "s3", self.region, expires=expiration).add_auth(request)
+        return request.prepare().url
+
     async def generate_presigned_upload_url(
         self,
         s3_key: str,
@@ -252,20 +656,21 @@ class S3Service:
             expiration = self.presigned_url_expiration
 
         try:
-            session, config = self._get_session()
-            async with session.client("s3", config=config) as s3_client:
-                params = {"Bucket": self.bucket_name, "Key": s3_key}
-                if content_type:
-                    params["ContentType"] = content_type
-
-                url = await s3_client.generate_presigned_url(
-                    "put_object",
-                    Params=params,
-                    ExpiresIn=expiration,
-                )
+            s3_client = await self._get_client()
+            params = {"Bucket": self.bucket_name, "Key": s3_key}
+            if content_type:
+                params["ContentType"] = content_type
+
+            url = await s3_client.generate_presigned_url(
+                "put_object",
+                Params=params,
+                ExpiresIn=expiration,
+            )
 
-                logger.debug(f"Generated pre-signed upload URL for {s3_key}")
-                return url
+            # The object is about to be replaced by the client
+            self._invalidate_stat(s3_key)
+            logger.debug(f"Generated pre-signed upload URL for {s3_key}")
+            return url
 
         except ClientError as e:
             logger.error(
@@ -279,6 +684,72 @@ class S3Service:
             )
             return None
 
+    async def stat(self, s3_key: str) -> Optional[ObjectStat]:
+        """
+        Get size, ETag and content type of an object in S3
+
+        Results for existing objects are cached for STAT_CACHE_TTL seconds,
+        and concurrent calls for the same key share a single HEAD request.
+
+        Args:
+            s3_key: S3 key of the object
+
+        Returns:
+            ObjectStat, or None if the object does not exist
+
+        Raises:
+            ClientError: If the HEAD request fails for another reason
+        """
+        cache_key = (self.bucket_name, s3_key)
+        entry = self._stats.get(cache_key)
+        if entry is not None:
+            object_stat, expires_at = entry
+            if time.monotonic() < expires_at:
+                return object_stat
+            self._stats.pop(cache_key, None)
+
+        request = self._stat_requests.get(cache_key)
+        if request is None:
+            request = asyncio.create_task(self._head_object(cache_key))
+            self._stat_requests[cache_key] = request
+        # Shielded so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(request)
+
+    async def _head_object(self, cache_key: tuple[str, str]) -> Optional[ObjectStat]:
+        bucket, s3_key = cache_key
+        try:
+            s3_client = await self._get_client()
+            async with self._request_slots:
+                response = await s3_client.head_object(Bucket=bucket, Key=s3_key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "404":
+                return None
+            raise
+        finally:
+            # Invalidation drops the request, so only the current one may
+            # clear itself and store its result
+            current = self._stat_requests.get(cache_key) is asyncio.current_task()
+            if current:
+                del self._stat_requests[cache_key]
+
+        object_stat = ObjectStat(
+            size=response["ContentLength"],
+            etag=response["ETag"],
+            content_type=response.get("ContentType"),
+        )
+        if current:
+            if len(self._stats) >= STAT_CACHE_MAX_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                self._stats.pop(next(iter(self._stats)))
+            self._stats[cache_key] = (object_stat, time.monotonic() + STAT_CACHE_TTL)
+        return object_stat
+
+    def _invalidate_stat(self, s3_key: str) -> None:
+        """Forget cached metadata after the object was written or deleted."""
+        cache_key = (self.bucket_name, s3_key)
+        self._stats.pop(cache_key, None)
+        self._stat_requests.pop(cache_key, None)
+
     async def file_exists(self, s3_key: str) -> bool:
         """
         Check if a file exists in S3
@@ -290,14 +761,9 @@ class S3Service:
             True if file exists, False otherwise
         """
         try:
-            session, config = self._get_session()
-            async with session.client("s3", config=config) as s3_client:
-                await s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
-                return True
+            return await self.stat(s3_key) is not None
 
         except ClientError as e:
-            if e.response["Error"]["Code"] == "404":
-                return False
             logger.error(f"Error checking if {s3_key} exists: {e}", exc_info=True)
             return False
         except Exception as e:
@@ -308,6 +774,16 @@ class S3Service:
         """
         Download a file from S3 to local filesystem.
 
+        The first part is requested as a ranged GET whose response also gives
+        the object's size, so objects up to DOWNLOAD_PART_SIZE take a single
+        streamed GET. Larger objects fetch their remaining parts as parallel
+        ranged GETs pinned to the first response's ETag, so an object
+        replaced mid-download fails instead of producing a mixed file.
+
+        Ranges are written to a temporary file next to local_path, which is
+        moved into place only once the whole object has arrived. A failed
+        download leaves any existing file at local_path untouched.
+
         Args:
             s3_key: S3 key of the file to download
             local_path: Local path where the file will be saved
@@ -318,18 +794,26 @@ class S3Service:
         Raises:
             ClientError: If S3 download fails
         """
+        tmp_path = f"{local_path}.{uuid4().hex[:8]}.part"
         try:
-            session, config = self._get_session()
-            async with session.client("s3", config=config) as s3_client:
-                logger.info(f"Downloading s3://{self.bucket_name}/{s3_key} to {local_path}")
+            s3_client = await self._get_client()
+            bucket = self.bucket_name
+            logger.info(f"Downloading s3://{bucket}/{s3_key} to {local_path}")
 
-                await s3_client.download_file(self.bucket_name, s3_key, local_path)
+            fd = await asyncio.to_thread(
+                os.open, tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644
+            )
+            try:
+                await self._download_ranges(s3_client, bucket, s3_key, fd)
+            finally:
+                os.close(fd)
+            await aiofiles.os.replace(tmp_path, local_path)
 
-                logger.info(f"Successfully downloaded {s3_key} to {local_path}")
-                return True
+            logger.info(f"Successfully downloaded {s3_key} to {local_path}")
+            return True
 
         except ClientError as e:
-            if e.response["Error"]["Code"] == "404":
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
                 logger.error(f"File not found in S3: {s3_key}")
             else:
                 logger.error(f"Failed to download {s3_key} from S3: {e}", exc_info=True)
@@ -337,6 +821,70 @@ class S3Service:
         except Exception as e:
             logger.error(f"Unexpected error downloading {s3_key} from S3: {e}", exc_info=True)
             return False
+        finally:
+            # Only left behind when the download did not complete
+            try:
+                await aiofiles.os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+
+    async def _download_ranges(self, s3_client, bucket: str, s3_key: str, fd: int) -> None:
+        settings = self._get_settings()
+        part_size = settings.DOWNLOAD_PART_SIZE
+        slots = asyncio.Semaphore(settings.DOWNLOAD_CONCURRENCY)
+
+        async def write_body(body, offset: int) -> None:
+            try:
+                async for chunk in body.iter_chunks(DOWNLOAD_WRITE_CHUNK_SIZE):
+                    await asyncio.to_thread(os.pwrite, fd, chunk, offset)
+                    offset += len(chunk)
+            finally:
+                body.close()
+
+        async def download_range(start: int, size: int, etag: str) -> None:
+            end = min(start + part_size, size) - 1
+            # The connection stays busy until the body has been read
+            async with slots, self._request_slots:
+                response = await s3_client.get_object(
+                    Bucket=bucket, Key=s3_key, Range=f"bytes={start}-{end}", IfMatch=etag
+                )
+                await write_body(response["Body"], start)
+
+        range_tasks: list[asyncio.Task] = []
+        try:
+            async with slots, self._request_slots:
+                try:
+                    first = await s3_client.get_object(
+                        Bucket=bucket, Key=s3_key, Range=f"bytes=0-{part_size - 1}"
+                    )
+                except ClientError as e:
+                    # Only an empty object cannot satisfy a range from byte 0
+                    if e.response["Error"]["Code"] == "InvalidRange":
+                        return
+                    raise
+
+                first_body = first["Body"]
+                try:
+                    # Content-Range is "bytes 0-<end>/<size>"
+                    size = int(first["ContentRange"].rsplit("/", 1)[1])
+                    if size > part_size:
+                        # Size the file up front so ranges can be written in any order
+                        await asyncio.to_thread(os.ftruncate, fd, size)
+                        range_tasks = [
+                            asyncio.create_task(download_range(start, size, first["ETag"]))
+                            for start in range(part_size, size, part_size)
+                        ]
+                except BaseException:
+                    first_body.close()
+                    raise
+                await write_body(first_body, 0)
+
+            await asyncio.gather(*range_tasks)
+        except BaseException:
+            for task in range_tasks:
+                task.cancel()
+            await asyncio.gather(*range_tasks, return_exceptions=True)
+            raise
 
     async def delete_file(self, s3_key: str) -> bool:
         """
@@ -349,11 +897,12 @@ class S3Service:
             True if deletion successful, False otherwise
         """
         try:
-            session, config = self._get_session()
-            async with session.client("s3", config=config) as s3_client:
+            s3_client = await self._get_client()
+            async with self._request_slots:
                 await s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
-                logger.info(f"Successfully deleted {s3_key} from S3")
-                return True
+            self._invalidate_stat(s3_key)
+            logger.info(f"Successfully deleted {s3_key} from S3")
+            return True
 
         except ClientError as e:
             logger.error(f"Failed to delete {s3_key} from S3: {e}", exc_info=True)
@@ -373,15 +922,13 @@ class S3Service:
             File size in bytes, or None if file doesn't exist or error occurs
         """
         try:
-            session, config = self._get_session()
-            async with session.client("s3", config=config) as s3_client:
-                response = await s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
-                return response["ContentLength"]
-
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "404":
+            object_stat = await self.stat(s3_key)
+            if object_stat is None:
                 logger.warning(f"File not found in S3: {s3_key}")
                 return None
+            return object_stat.size
+
+        except ClientError as e:
             logger.error(f"Error getting file size for {s3_key}: {e}", exc_info=True)
             return None
         except Exception as e:
@@ -400,27 +947,7 @@ class S3Service:
             MIME type string
         """
         extension = os.path.splitext(file_path)[1].lower()
-
-        content_types = {
-            ".mp4": "video/mp4",
-            ".webm": "video/webm",
-            ".avi": "video/x-msvideo",
-            ".mov": "video/quicktime",
-            ".mkv": "video/x-matroska",
-            ".mp3": "audio/mpeg",
-            ".wav": "audio/wav",
-            ".m4a": "audio/mp4",
-            ".ogg": "audio/ogg",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".png": "image/png",
-            ".gif": "image/gif",
-            ".webp": "image/webp",
-            ".pdf": "application/pdf",
-            ".json": "application/json",
-        }
-
-        return content_types.get(extension, "application/octet-stream")
+        return _CONTENT_TYPES.get(extension, "application/octet-stream")
 
     def generate_s3_key(
         self,
@@ -7,11 +7,62 @@ import os
 import shutil
 from typing import Optional
 
+import aiofiles.os
+
 logger = logging.getLogger(__name__)
 
 # Maximum duration for training videos (in seconds)
 MAX_TRAINING_VIDEO_DURATION = 60
 
+# Only the tail of a failed tool's stderr is decoded for logging
+STDERR_LOG_LIMIT = 4096
+
+# Upper bounds (in seconds) before a stuck ffprobe/ffmpeg is killed
+FFPROBE_TIMEOUT = 30
+FFMPEG_TIMEOUT = 300
+
+
+def _stderr_tail(stderr: bytes) -> str:
+    """Decode the end of a subprocess's stderr for logging."""
+    return stderr[-STDERR_LOG_LIMIT:].decode("utf-8", errors="replace")
+
+
+async def _communicate(
+    process: asyncio.subprocess.Process,
+    timeout: float,
+) -> tuple[Optional[bytes], Optional[bytes]]:
+    """
+    Wait for a subprocess to finish, killing it if it overruns or the caller is cancelled.
+
+    Without this a timed-out or cancelled request would leave the child running
+    (and holding its pipes) with nobody left to reap it.
+    """
+    try:
+        return await asyncio.wait_for(process.communicate(), timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+
+
+# Executable name -> absolute path, for binaries that were found on PATH
+_binary_paths: dict[str, str] = {}
+
+
+def _resolve_binary(name: str) -> Optional[str]:
+    """Resolve an executable on PATH once instead of on every spawn.
+
+    Missing binaries are not cached, so installing one later is picked up
+    without restarting the process.
+    """
+    path = _binary_paths.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _binary_paths[name] = path
+    return path
+
 
 async def get_video_duration(file_path: str) -> Optional[float]:
     """
@@ -23,17 +74,18 @@ async def get_video_duration(file_path: str) -> Optional[float]:
     Returns:
         Duration in seconds, or None if unable to determine
     """
-    if not os.path.exists(file_path):
+    if not await aiofiles.os.path.exists(file_path):
         logger.error(f"Video file not found: {file_path}")
         return None
 
     try:
         # Using create_subprocess_exec (not shell) for security - arguments passed as list
         cmd = [
-            "ffprobe",
+            _resolve_binary("ffprobe") or "ffprobe",
             "-v", "quiet",
             "-print_format", "json",
-            "-show_format",
+            # Only the container duration is needed; skip tags and other fields
+            "-show_entries", "format=duration",
             file_path,
         ]
 
@@ -42,17 +94,20 @@ async def get_video_duration(file_path: str) -> Optional[float]:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await process.communicate()
+        stdout, stderr = await _communicate(process, FFPROBE_TIMEOUT)
 
         if process.returncode != 0:
-            logger.error(f"ffprobe failed: {stderr.decode()}")
+            logger.error(f"ffprobe failed: {_stderr_tail(stderr)}")
             return None
 
-        data = json.loads(stdout.decode())
+        data = json.loads(stdout)
         duration = float(data["format"]["duration"])
         logger.info(f"Video duration: {duration:.2f}s for {file_path}")
         return duration
 
+    except asyncio.TimeoutError:
+        logger.error(f"ffprobe timed out after {FFPROBE_TIMEOUT}s for {file_path}")
+        return None
     except (json.JSONDecodeError, KeyError) as e:
         logger.error(f"Failed to parse ffprobe output: {e}")
         return None
@@ -68,6 +123,7 @@ async def trim_video(
     input_path: str,
     output_path: str,
     max_duration: int = MAX_TRAINING_VIDEO_DURATION,
+    duration: Optional[float] = None,
 ) -> bool:
     """
     Trim video to specified max duration using FFmpeg.
@@ -78,11 +134,13 @@ async def trim_video(
         input_path: Path to input video file
         output_path: Path for trimmed output video
         max_duration: Maximum duration in seconds (default: 60)
+        duration: Already-probed duration of the input, to skip a second ffprobe
 
     Returns:
         True if video was trimmed, False if no trimming needed or error
     """
-    duration = await get_video_duration(input_path)
+    if duration is None:
+        duration = await get_video_duration(input_path)
 
     if duration is None:
         logger.error(f"Could not determine duration for {input_path}")
@@ -97,8 +155,12 @@ async def trim_video(
     try:
         # Using create_subprocess_exec (not shell) for security - arguments passed as list
         cmd = [
-            "ffmpeg",
+            _resolve_binary("ffmpeg") or "ffmpeg",
             "-y",  # Overwrite output
+            "-nostdin",  # Never read from the server's stdin
+            # Only errors reach stderr, so the captured pipe stays small
+            "-hide_banner", "-nostats",
+            "-loglevel", "error",
             "-i", input_path,
             "-t", str(max_duration),
             "-c", "copy",  # Stream copy (no re-encoding)
@@ -106,25 +168,29 @@ async def trim_video(
             output_path,
         ]
 
+        # ffmpeg writes nothing useful to stdout here, so don't buffer it
         process = await asyncio.create_subprocess_exec(
             *cmd,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await process.communicate()
+        _, stderr = await _communicate(process, FFMPEG_TIMEOUT)
 
         if process.returncode != 0:
-            logger.error(f"FFmpeg trim failed: {stderr.decode()}")
+            logger.error(f"FFmpeg trim failed: {_stderr_tail(stderr)}")
             return False
 
         # Verify output file exists
-        if not os.path.exists(output_path):
+        if not await aiofiles.os.path.exists(output_path):
             logger.error(f"Trimmed video not created: {output_path}")
             return False
 
         logger.info(f"Video trimmed successfully: {output_path}")
         return True
 
+    except asyncio.TimeoutError:
+        logger.error(f"FFmpeg trim timed out after {FFMPEG_TIMEOUT}s for {input_path}")
+        return False
     except FileNotFoundError:
         logger.error("ffmpeg not found. Please install FFmpeg.")
         return False
@@ -172,7 +238,9 @@ class VideoService:
             output_path = f"{base}_trimmed{ext}"
 
         # Trim the video
-        success = await trim_video(input_path, output_path, self.max_training_duration)
+        success = await trim_video(
+            input_path, output_path, self.max_training_duration, duration=duration
+        )
 
         if not success:
             raise ValueError(f"Failed to trim video: {input_path}")
@@ -182,7 +250,7 @@ class VideoService:
     @staticmethod
     def is_ffmpeg_available() -> bool:
         """Check if FFmpeg is available on the system"""
-        return shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
+        return _resolve_binary("ffmpeg") is not None and _resolve_binary("ffprobe") is not None
 
 
 # Global instance
@@ -1,4 +1,5 @@
 import os
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 
@@ -22,6 +23,10 @@ from app.utils import (
     API_PREFIX,
 )
 from app.utils.sentry_utils import capture_exception
+from app.services.avatar_job import runpod_client
+from app.services.firebase import initialize_firebase, start_key_refresh, stop_key_refresh
+from app.services.livetalking import livetalking_service
+from app.services.s3 import s3_service
 from app.routers import (
     auth_router,
     users_router,
@@ -41,12 +46,35 @@ sentry_enabled = configure_sentry()
 if sentry_enabled:
     logger.info("Sentry error tracking initialized")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks."""
+    # Initialize Firebase once so verify_token does not check on every request
+    try:
+        firebase_app = initialize_firebase()
+        # Cache Google's signing keys so ID tokens are verified in-process
+        await start_key_refresh(firebase_app.project_id)
+    except Exception as e:
+        # Keep serving (health checks, internal endpoints); auth requests
+        # will fail until credentials are provided
+        logger.error(f"Firebase initialization failed: {e}")
+
+    yield
+    await stop_key_refresh()
+    # Close shared HTTP clients so pooled connections are released cleanly
+    await runpod_client.aclose()
+    await livetalking_service.aclose()
+    await s3_service.aclose()
+
+
 app = FastAPI(
     title="Video Clone Backend",
     description="AI Clone Video Generation Service API",
     version="0.1.0",
     docs_url=None,
     redoc_url=None,
+    lifespan=lifespan,
 )
 
 # CORS configuration - allow all origins
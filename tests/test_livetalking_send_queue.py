@@ -0,0 +1,73 @@
+"""Tests for the LiveTalking text send queue"""
+
+import asyncio
+import json
+import unittest
+
+import httpx
+
+from app.services.livetalking.livetalking_service import LiveTalkingService
+
+
+class SendQueueTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.posted: list[tuple[str, bool]] = []
+        self.release = asyncio.Event()
+        self.in_flight = asyncio.Event()
+        self.fail = False
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            if self.fail:
+                raise httpx.ConnectError("connection refused", request=request)
+            if body["text"] == "slow":
+                self.in_flight.set()
+                await self.release.wait()
+            self.posted.append((body["text"], body["interrupt"]))
+            return httpx.Response(200)
+
+        self.service = LiveTalkingService()
+        self.service._client = httpx.AsyncClient(
+            base_url="http://livetalking", transport=httpx.MockTransport(handler)
+        )
+
+    async def asyncTearDown(self):
+        await self.service.aclose()
+
+    async def test_queued_send_returns_false(self):
+        self.assertFalse(await self.service.send_text(1, "hello", interrupt=False))
+        await self.service.flush()
+        self.assertEqual(self.posted, [("hello", False)])
+
+    async def test_interrupt_during_drain_is_sent_after_in_flight_text(self):
+        await self.service.send_text(1, "slow", interrupt=False)
+        await self.in_flight.wait()
+        await self.service.send_text(1, "stale", interrupt=False)
+
+        interrupt = asyncio.create_task(self.service.send_text(1, "stop", interrupt=True))
+        await asyncio.sleep(0.01)
+        # The interrupt waits for the queued text already being posted
+        self.assertFalse(interrupt.done())
+
+        self.release.set()
+        self.assertTrue(await interrupt)
+        await self.service.flush()
+
+        # The in-flight text is cut off by the interrupt that follows it, and
+        # the text queued before the interrupt is dropped
+        self.assertEqual(self.posted, [("slow", False), ("stop", True)])
+
+    async def test_queued_failure_is_raised_by_next_send(self):
+        self.fail = True
+        await self.service.send_text(1, "hello", interrupt=False)
+        await self.service.flush()
+
+        self.fail = False
+        with self.assertRaises(ConnectionError):
+            await self.service.send_text(1, "again", interrupt=False)
+        # The failure is reported once
+        self.assertFalse(await self.service.send_text(1, "again", interrupt=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
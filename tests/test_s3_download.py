@@ -0,0 +1,134 @@
+"""Round-trip tests for S3Service.download_file against a local S3 endpoint"""
+
+import hashlib
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from aiohttp import web
+
+from app.services.s3.s3_config import get_s3_settings
+from app.services.s3.s3_service import S3Service
+
+BUCKET = "test-bucket"
+PART_SIZE = 64 * 1024
+
+
+def _error(status: int, code: str) -> web.Response:
+    body = f"<Error><Code>{code}</Code><Message>{code}</Message></Error>"
+    return web.Response(status=status, body=body, content_type="application/xml")
+
+
+class FakeS3:
+    """Serves ranged GETs of in-memory objects the way S3 does"""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.requests: list[tuple[str, str]] = []
+        # Replaces the object after the first GET, as a concurrent upload would
+        self.replace_after_first_get: dict[str, bytes] = {}
+
+    async def handle(self, request: web.Request) -> web.Response:
+        bucket, _, key = request.path.lstrip("/").partition("/")
+        self.requests.append((key, request.headers.get("Range", "")))
+        data = self.objects.get(key)
+        if bucket != BUCKET or data is None:
+            return _error(404, "NoSuchKey")
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        if key in self.replace_after_first_get:
+            self.objects[key] = self.replace_after_first_get.pop(key)
+        if_match = request.headers.get("If-Match")
+        if if_match is not None and if_match != etag:
+            return _error(412, "PreconditionFailed")
+
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if match is None:
+            return web.Response(body=data, headers={"ETag": etag})
+        start, end = int(match[1]), min(int(match[2]), len(data) - 1)
+        if start >= len(data):
+            return _error(416, "InvalidRange")
+        return web.Response(
+            status=206,
+            body=data[start : end + 1],
+            headers={"ETag": etag, "Content-Range": f"bytes {start}-{end}/{len(data)}"},
+        )
+
+
+class DownloadFileTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.s3 = FakeS3()
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.s3.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        env = mock.patch.dict(
+            os.environ,
+            {
+                "AWS_ENDPOINT_URL_S3": f"http://127.0.0.1:{port}",
+                "S3_AWS_ACCESS_KEY_ID": "test",
+                "S3_AWS_SECRET_ACCESS_KEY": "test",
+                "S3_BUCKET_NAME": BUCKET,
+                "S3_DOWNLOAD_PART_SIZE": str(PART_SIZE),
+                "S3_DOWNLOAD_CONCURRENCY": "2",
+            },
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        get_s3_settings.cache_clear()
+        self.addCleanup(get_s3_settings.cache_clear)
+
+        self.service = S3Service()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.path = os.path.join(self.dir, "video.mp4")
+
+    async def asyncTearDown(self):
+        await self.service.aclose()
+        await self.runner.cleanup()
+
+    async def assert_round_trip(self, data: bytes) -> None:
+        self.s3.objects["video.mp4"] = data
+        self.assertTrue(await self.service.download_file("video.mp4", self.path))
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), data)
+        self.assertEqual(os.listdir(self.dir), ["video.mp4"])
+
+    async def test_single_part_object_takes_one_get(self):
+        await self.assert_round_trip(os.urandom(1000))
+        self.assertEqual(len(self.s3.requests), 1)
+
+    async def test_object_of_exactly_one_part(self):
+        await self.assert_round_trip(os.urandom(PART_SIZE))
+        self.assertEqual(len(self.s3.requests), 1)
+
+    async def test_multi_part_object(self):
+        await self.assert_round_trip(os.urandom(3 * PART_SIZE + 1))
+        self.assertEqual(len(self.s3.requests), 4)
+
+    async def test_empty_object(self):
+        await self.assert_round_trip(b"")
+
+    async def test_missing_object_leaves_existing_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"previous")
+        self.assertFalse(await self.service.download_file("missing.mp4", self.path))
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"previous")
+        self.assertEqual(os.listdir(self.dir), ["video.mp4"])
+
+    async def test_object_replaced_mid_download_fails(self):
+        self.s3.objects["video.mp4"] = os.urandom(2 * PART_SIZE)
+        self.s3.replace_after_first_get["video.mp4"] = os.urandom(2 * PART_SIZE)
+        self.assertFalse(await self.service.download_file("video.mp4", self.path))
+        self.assertEqual(os.listdir(self.dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()